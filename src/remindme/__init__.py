@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from remindme.backends import AtBackend, AutoBackend, Backend, SystemdBackend
-from remindme.models import At, In, Method, Options
+if TYPE_CHECKING:
+    from remindme.backends import AtBackend, AutoBackend, Backend, SystemdBackend
+    from remindme.models import At, Batch, In, Method, Options
 
 __all__ = [
     "At",
     "AtBackend",
     "AutoBackend",
     "Backend",
+    "Batch",
     "In",
     "Method",
     "Options",
     "SystemdBackend",
 ]
+
+_MODEL_EXPORTS = frozenset({"At", "Batch", "In", "Method", "Options"})
+_BACKEND_EXPORTS = frozenset({"AtBackend", "AutoBackend", "Backend", "SystemdBackend"})
+
+
+def __getattr__(name: str) -> object:
+    """Resolve re-exported names on first access (PEP 562).
+
+    Eager re-exports would drag backends (subprocess, shlex) and models
+    into every `import remindme`, even for invocations that never touch
+    them.
+    """
+    if name in _MODEL_EXPORTS:
+        from remindme import models  # noqa: PLC0415
+
+        return getattr(models, name)
+    if name in _BACKEND_EXPORTS:
+        from remindme import backends  # noqa: PLC0415
+
+        return getattr(backends, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,24 @@ from __future__ import annotations
 
 import logging
 import sys
+from datetime import datetime
 
 from remindme.cli import parse_args
-from remindme.models import At, In, Options
+from remindme.models import At, Batch, In, Method, Options
 from remindme.utils import check_notify_send, verbosity_to_log_level
 
 
+def _resolve_batch(methods: tuple[Method, ...]) -> list[tuple[datetime, str, str]]:
+    """Resolve batch entries to absolute times for Backend.schedule_many."""
+    now = datetime.now()
+    return [
+        (now + m.duration, m.title, m.message)
+        if isinstance(m, In)
+        else (m.when, m.title, m.message)
+        for m in methods
+    ]
+
+
 def main(opt: Options) -> int:
     """Run remindme with the given options.
 
@@ -28,11 +40,19 @@ def main(opt: Options) -> int:
 
     logging.debug("Selected backend: %s", type(opt.backend).__name__)
 
+    # A single-shot invocation's scheduling call is the last thing this
+    # process does, so the backend may exec its final command in place.
+    # Batches schedule several commands and must keep forking.
+    if not isinstance(opt.method, Batch):
+        opt.backend.terminal = True
+
     match opt.method:
         case In(duration=duration, message=msg, title=title):
             opt.backend.schedule_in(duration=duration, title=title, message=msg)
         case At(when=when, message=msg, title=title):
             opt.backend.schedule_at(when=when, title=title, message=msg)
+        case Batch(methods=methods):
+            opt.backend.schedule_many(_resolve_batch(methods))
 
     return 0
 
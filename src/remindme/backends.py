@@ -4,18 +4,30 @@ from __future__ import annotations
 
 import logging
 import shlex
-import shutil
 import subprocess
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from typing import Sequence
 
 from remindme.parsers import format_systemd_duration
-from remindme.utils import die, run, unit_name
+from remindme.utils import die, exec_final, run, unit_name, which
+
+log = logging.getLogger(__name__)
+
+# Constant parts of the systemd-run invocation; splicing them with [*t, ...]
+# compiles to a single LIST_EXTEND instead of rebuilding the literal.
+_SYSTEMD_PREFIX = ("systemd-run", "--user", "--unit")
+_NOTIFY_SEP = ("--", "notify-send")
 
 
 class Backend(ABC):
     """Strategy interface for scheduling backends."""
 
+    # When true, a backend may replace the current process with its final
+    # scheduling command instead of forking it. The CLI enables this for
+    # single-shot invocations; library callers and tests keep the default.
+    terminal: bool = False
+
     @abstractmethod
     def schedule_in(self, duration: timedelta, title: str, message: str) -> None:
         """Schedule a reminder after a duration."""
@@ -24,6 +36,15 @@ class Backend(ABC):
     def schedule_at(self, when: datetime, title: str, message: str) -> None:
         """Schedule a reminder at a specific datetime."""
 
+    def schedule_many(self, items: Sequence[tuple[datetime, str, str]]) -> None:
+        """Schedule several reminders; items are (when, title, message).
+
+        Default: one scheduling call (one subprocess) per reminder.
+        Backends override this when they can batch submissions cheaper.
+        """
+        for when, title, message in items:
+            self.schedule_at(when, title, message)
+
     @staticmethod
     @abstractmethod
     def is_available() -> bool:
@@ -47,43 +68,43 @@ class SystemdBackend(Backend):
 
     def schedule_in(self, duration: timedelta, title: str, message: str) -> None:
         on_active = format_systemd_duration(duration)
-        unit = unit_name(prefix="remindme", when=datetime.now() + duration)
-        cmd = [
-            "systemd-run",
-            "--user",
-            "--unit",
-            unit,
-            "--on-active",
-            on_active,
-            "--",
-            "notify-send",
-            title,
-            message,
-        ]
-        logging.info("Scheduling reminder in %s via systemd (%s)", on_active, unit)
-        run(cmd)
+        # Resolve the target time once so the unit name and anything logged
+        # about this reminder agree on the same timestamp.
+        when = datetime.now() + duration
+        unit = unit_name(prefix="remindme", when=when)
+        log.info("Scheduling reminder in %s via systemd (%s)", on_active, unit)
+        self._schedule(unit, "--on-active", on_active, title, message)
 
     def schedule_at(self, when: datetime, title: str, message: str) -> None:
         unit = unit_name(prefix="remindme", when=when)
-        on_calendar = when.strftime("%Y-%m-%d %H:%M:%S")
+        on_calendar = (
+            f"{when.year:04d}-{when.month:02d}-{when.day:02d}"
+            f" {when.hour:02d}:{when.minute:02d}:{when.second:02d}"
+        )
+        log.info("Scheduling reminder at %s via systemd (%s)", on_calendar, unit)
+        self._schedule(unit, "--on-calendar", on_calendar, title, message)
+
+    def _schedule(
+        self, unit: str, timing_flag: str, timing_value: str, title: str, message: str
+    ) -> None:
+        """Spawn systemd-run for a unit with the given timing flag."""
         cmd = [
-            "systemd-run",
-            "--user",
-            "--unit",
+            *_SYSTEMD_PREFIX,
             unit,
-            "--on-calendar",
-            on_calendar,
-            "--",
-            "notify-send",
+            timing_flag,
+            timing_value,
+            *_NOTIFY_SEP,
             title,
             message,
         ]
-        logging.info("Scheduling reminder at %s via systemd (%s)", on_calendar, unit)
-        run(cmd)
+        if self.terminal:
+            exec_final(cmd)
+        else:
+            run(cmd)
 
     @staticmethod
     def is_available() -> bool:
-        return shutil.which("systemd-run") is not None
+        return which("systemd-run") is not None
 
 
 class AtBackend(Backend):
@@ -106,15 +127,37 @@ class AtBackend(Backend):
         self.schedule_at(when, title, message)
 
     def schedule_at(self, when: datetime, title: str, message: str) -> None:
-        # at -t expects [[CC]YY]MMDDhhmm[.ss]
-        ts = when.strftime("%Y%m%d%H%M")
-        shell_cmd = _build_notify_shell_command(title=title, message=message)
-        logging.debug("at -t %s", ts)
+        self._submit(
+            _at_timestamp(when),
+            _build_notify_shell_command(title=title, message=message),
+        )
+        log.info(
+            "Scheduling reminder at %s via at",
+            when.isoformat(sep=" ", timespec="minutes"),
+        )
+
+    def schedule_many(self, items: Sequence[tuple[datetime, str, str]]) -> None:
+        """Group reminders by minute so each distinct time costs one at job."""
+        by_timestamp: dict[str, list[str]] = {}
+        for when, title, message in items:
+            by_timestamp.setdefault(_at_timestamp(when), []).append(
+                _build_notify_shell_command(title=title, message=message)
+            )
+        for ts, commands in by_timestamp.items():
+            self._submit(ts, *commands)
+        log.info(
+            "Scheduling %d reminders via %d at jobs", len(items), len(by_timestamp)
+        )
 
+    @staticmethod
+    def _submit(ts: str, *commands: str) -> None:
+        """Submit one at job running the given shell commands."""
+        log.debug("at -t %s", ts)
+        script = "\n".join(commands) + "\n"
         try:
             subprocess.run(
                 ["at", "-t", ts],
-                input=(shell_cmd + "\n").encode("utf-8"),
+                input=script.encode("utf-8"),
                 capture_output=True,
                 check=True,
                 text=False,
@@ -127,14 +170,9 @@ class AtBackend(Backend):
             )
             die(f"at failed:\n{stderr}")
 
-        logging.info(
-            "Scheduling reminder at %s via at",
-            when.isoformat(sep=" ", timespec="minutes"),
-        )
-
     @staticmethod
     def is_available() -> bool:
-        return shutil.which("at") is not None
+        return which("at") is not None
 
 
 class AutoBackend(Backend):
@@ -161,7 +199,8 @@ class AutoBackend(Backend):
         """Lazy initialization: select delegate on first access."""
         if self._delegate is None:
             self._delegate = self._select_delegate()
-            logging.debug("AutoBackend selected: %s", type(self._delegate).__name__)
+            self._delegate.terminal = self.terminal
+            log.debug("AutoBackend selected: %s", type(self._delegate).__name__)
         return self._delegate
 
     @staticmethod
@@ -180,6 +219,9 @@ class AutoBackend(Backend):
     def schedule_at(self, when: datetime, title: str, message: str) -> None:
         self.delegate.schedule_at(when, title, message)
 
+    def schedule_many(self, items: Sequence[tuple[datetime, str, str]]) -> None:
+        self.delegate.schedule_many(items)
+
     @staticmethod
     def is_available() -> bool:
         return any(
@@ -196,6 +238,13 @@ BACKENDS: dict[str, type[Backend]] = {
 }
 
 
+def _at_timestamp(when: datetime) -> str:
+    """Format a datetime for at -t, which expects [[CC]YY]MMDDhhmm[.ss]."""
+    return (
+        f"{when.year:04d}{when.month:02d}{when.day:02d}{when.hour:02d}{when.minute:02d}"
+    )
+
+
 def _build_notify_shell_command(*, title: str, message: str) -> str:
     """Build shell command for notify-send with properly quoted arguments.
 
@@ -203,10 +252,4 @@ def _build_notify_shell_command(*, title: str, message: str) -> str:
     The 'at' command executes this via /bin/sh, but quoted args are safe.
     """
     # We intentionally build a shell command for 'at' input.
-    return " ".join(
-        [
-            "notify-send",
-            shlex.quote(title),
-            shlex.quote(message),
-        ]
-    )
+    return f"notify-send {shlex.quote(title)} {shlex.quote(message)}"
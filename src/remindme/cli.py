@@ -2,14 +2,50 @@
 
 from __future__ import annotations
 
-import argparse
-from typing import Sequence
+import functools
+import shlex
+import sys
+from typing import TYPE_CHECKING, Sequence
 
 from remindme.backends import BACKENDS, Backend
-from remindme.models import At, In, Method, Options
+from remindme.models import At, Batch, In, Method, Options
 from remindme.parsers import parse_duration, parse_when
 from remindme.utils import die
 
+if TYPE_CHECKING:
+    from typing import NoReturn
+
+_USAGE = (
+    "usage: remindme [-h] [--backend {auto,systemd,at}] [--title TITLE]"
+    " [--file FILE] [-v | -q] {in,at} ..."
+)
+
+_IN_HELP = """\
+usage: remindme in [-h] duration message ...
+
+Remind after a delay, e.g. 30m, 2h, 45s, 1d.
+
+positional arguments:
+  duration    Delay like 30m / 2h / 45s / 1d.
+  message     Reminder message.
+
+options:
+  -h, --help  show this help message and exit
+"""
+
+_AT_HELP = """\
+usage: remindme at [-h] when message ...
+
+Remind at a time, e.g. 3pm, 15:00, or a full datetime.
+
+positional arguments:
+  when        Time like 3pm / 15:00 / 2026-01-15 15:00.
+  message     Reminder message.
+
+options:
+  -h, --help  show this help message and exit
+"""
+
 
 def parse_backend(name: str) -> Backend:
     """Parse backend name and return an instantiated Backend.
@@ -23,11 +59,28 @@ def parse_backend(name: str) -> Backend:
     Raises:
         argparse.ArgumentTypeError: If backend unknown or unavailable
     """
+    # argparse is only needed for its exception type; don't pay its import
+    # cost (gettext, textwrap, ...) on the happy path.
+    import argparse  # noqa: PLC0415
+
+    # Defensive: parse_args validates the --backend choice before calling us,
+    # but this is public API and library callers pass arbitrary names.
     if name not in BACKENDS:
         raise argparse.ArgumentTypeError(
             f"unknown backend '{name}': choose from {', '.join(BACKENDS.keys())}"
         )
 
+    if name == "auto":
+        # Resolve the concrete backend here rather than handing back an
+        # AutoBackend wrapper: the wrapper would probe is_available() all
+        # over again on the first scheduling call.
+        for candidate_name, candidate_cls in BACKENDS.items():
+            if candidate_name != "auto" and candidate_cls.is_available():
+                return candidate_cls()
+        raise argparse.ArgumentTypeError(
+            f"backend '{name}' is not available on this system"
+        )
+
     backend_cls = BACKENDS[name]
     if not backend_cls.is_available():
         raise argparse.ArgumentTypeError(
@@ -37,8 +90,13 @@ def parse_backend(name: str) -> Backend:
     return backend_cls()
 
 
+@functools.cache
 def format_backend_details() -> str:
-    """Generate detailed backend documentation for epilog."""
+    """Generate detailed backend documentation for epilog.
+
+    Cached: the backend registry and its docstrings never change within a
+    process, and help may be rendered more than once (e.g. in tests).
+    """
     lines: list[str] = []
     for name, backend_cls in BACKENDS.items():
         doc = backend_cls.__doc__ or ""
@@ -53,19 +111,28 @@ def format_backend_details() -> str:
     return "\n".join(lines)
 
 
-def parse_args(argv: Sequence[str]) -> Options:
-    """Parse command-line arguments.
+def _print_help() -> NoReturn:
+    """Print full program help (with backend details) and exit."""
+    help_text = f"""\
+{_USAGE}
 
-    Args:
-        argv: Command-line arguments (without program name)
+Schedule a desktop notification reminder.
 
-    Returns:
-        Parsed options
+positional arguments:
+  {{in,at}}
+    in                  Remind after a delay, e.g. 30m, 2h, 45s, 1d.
+    at                  Remind at a time, e.g. 3pm, 15:00, or a full datetime.
+
+options:
+  -h, --help            show this help message and exit
+  --backend {{auto,systemd,at}}
+                        Scheduler backend to use (default: auto)
+  --title TITLE         Notification title (default: Reminder).
+  --file FILE           Schedule reminders from a batch file, one per line:
+                        'in 30m message' or 'at 3pm message'.
+  -v, --verbose         Increase verbosity (-v: INFO, -vv: DEBUG).
+  -q, --quiet           Decrease verbosity (-q: ERROR, -qq: silence non-critical).
 
-    Raises:
-        SystemExit: If arguments are invalid
-    """
-    epilog = f"""
 Backend Details:
 {format_backend_details()}
 Examples:
@@ -81,79 +148,182 @@ Examples:
   # Use specific backend with verbose output
   remindme -vv --backend systemd in 1h "Check deployment"
 """
+    print(help_text)
+    raise SystemExit(0)
 
-    p = argparse.ArgumentParser(
-        prog="remindme",
-        description="Schedule a desktop notification reminder.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=epilog,
-    )
-    p.add_argument(
-        "--backend",
-        type=str,
-        choices=list(BACKENDS.keys()),
-        default="auto",
-        help="Scheduler backend to use (default: auto)",
-    )
-    p.add_argument(
-        "--title",
-        default="Reminder",
-        help="Notification title (default: Reminder).",
-    )
-    verbosity_group = p.add_mutually_exclusive_group()
-    verbosity_group.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase verbosity (-v: INFO, -vv: DEBUG).",
-    )
-    verbosity_group.add_argument(
-        "-q",
-        "--quiet",
-        action="count",
-        default=0,
-        help="Decrease verbosity (-q: ERROR, -qq: silence non-critical).",
-    )
 
-    sub = p.add_subparsers(dest="command", required=True)
+def _usage_error(msg: str) -> NoReturn:
+    """Print usage and an argparse-style error to stderr, then exit 2."""
+    print(_USAGE, file=sys.stderr)
+    print(f"remindme: error: {msg}", file=sys.stderr)
+    raise SystemExit(2)
 
-    p_in = sub.add_parser("in", help="Remind after a delay, e.g. 30m, 2h, 45s, 1d.")
-    p_in.add_argument(
-        "duration", type=parse_duration, help="Delay like 30m / 2h / 45s / 1d."
-    )
-    p_in.add_argument("message", nargs=argparse.REMAINDER, help="Reminder message.")
 
-    p_at = sub.add_parser(
-        "at", help="Remind at a time, e.g. 3pm, 15:00, or a full datetime."
-    )
-    p_at.add_argument(
-        "when", type=parse_when, help="Time like 3pm / 15:00 / 2026-01-15 15:00."
-    )
-    p_at.add_argument("message", nargs=argparse.REMAINDER, help="Reminder message.")
+def _grouped_count(arg: str, letter: str) -> int:
+    """Length of a grouped short flag like ``-vv`` / ``-qqq``, or 0."""
+    repeats = len(arg) - 1
+    if arg.startswith("-") and repeats > 1 and set(arg[1:]) == {letter}:
+        return repeats
+    return 0
 
-    ns = p.parse_args(list(argv))
 
-    # Calculate verbosity: default is -1 (WARN), -v increases, -q decreases
-    verbosity = -1 + ns.verbose - ns.quiet
-
-    # Resolve backend if using default
-    backend = parse_backend(ns.backend) if isinstance(ns.backend, str) else ns.backend
-
-    title = ns.title
-    method: Method
-    if ns.command == "in":
-        msg = " ".join(ns.message).strip()
-        if not msg:
-            die("message is required")
-        method = In(duration=ns.duration, message=msg, title=title)
-    elif ns.command == "at":
-        msg = " ".join(ns.message).strip()
-        if not msg:
-            die("message is required")
-        method = At(when=ns.when, message=msg, title=title)
+def _scan_options(args: list[str]) -> tuple[int, dict[str, str], int, int]:
+    """Consume leading options up to the subcommand.
+
+    Args:
+        args: Full argument list
+
+    Returns:
+        Tuple of (subcommand index, option values, verbose count, quiet count)
+
+    Raises:
+        SystemExit: On help requests or unknown options
+    """
+    values = {"--backend": "auto", "--title": "Reminder", "--file": ""}
+    verbose = 0
+    quiet = 0
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        key, eq, inline = arg.partition("=")
+        if arg in ("-h", "--help"):
+            _print_help()
+        elif key in values:
+            if eq:
+                values[key] = inline
+            elif i + 1 < len(args):
+                i += 1
+                values[key] = args[i]
+            else:
+                _usage_error(f"argument {key}: expected one argument")
+        elif arg in ("-v", "--verbose") or _grouped_count(arg, "v"):
+            verbose += _grouped_count(arg, "v") or 1
+        elif arg in ("-q", "--quiet") or _grouped_count(arg, "q"):
+            quiet += _grouped_count(arg, "q") or 1
+        elif arg in ("in", "at"):
+            break
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+        i += 1
+    return i, values, verbose, quiet
+
+
+def _require_message(rest: list[str]) -> str:
+    """Join the trailing message tokens, erroring if empty."""
+    msg = " ".join(rest[1:]).strip()
+    if not msg:
+        die("message is required")
+    return msg
+
+
+def _parse_command(command: str, rest: list[str], title: str) -> Method:
+    """Parse an in/at subcommand with its positional arguments."""
+    if rest and rest[0] in ("-h", "--help"):
+        print(_IN_HELP if command == "in" else _AT_HELP)
+        raise SystemExit(0)
+
+    if not rest:
+        _usage_error(
+            "the following arguments are required: "
+            + ("duration" if command == "in" else "when")
+        )
+
+    if command == "in":
+        duration = parse_duration(rest[0])
+        return In(duration=duration, message=_require_message(rest), title=title)
+    when = parse_when(rest[0])
+    return At(when=when, message=_require_message(rest), title=title)
+
+
+def _parse_batch_file(path: str, title: str) -> Batch:
+    """Parse a batch file into a Batch of reminders.
+
+    One reminder per line, mirroring the CLI subcommands:
+    ``in <duration> <message>`` or ``at <when> <message>``. Quote times
+    containing spaces (e.g. ``at "2026-01-16 09:00" standup``). Blank lines
+    and lines starting with '#' are ignored.
+
+    Args:
+        path: Batch file to read
+        title: Notification title applied to every reminder
+
+    Returns:
+        Parsed batch
+
+    Raises:
+        SystemExit: If the file is unreadable or a line is malformed
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError as e:
+        die(f"could not read batch file: {e}")
+
+    methods: list[Method] = []
+    for lineno, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            command, *tokens = shlex.split(stripped)
+        except ValueError as e:
+            die(f"{path}:{lineno}: {e}")
+        if command not in ("in", "at") or len(tokens) < 2:  # noqa: PLR2004
+            die(
+                f"{path}:{lineno}: expected"
+                " 'in <duration> <message>' or 'at <when> <message>'"
+            )
+        methods.append(_parse_command(command, tokens, title))
+
+    if not methods:
+        die(f"batch file {path!r} contains no reminders")
+    return Batch(methods=tuple(methods))
+
+
+def parse_args(argv: Sequence[str]) -> Options:
+    """Parse command-line arguments.
+
+    Hand-rolled tokenizer: a full argparse parser (subparsers, groups,
+    formatted epilog) is overkill for the ~5 tokens this CLI ever sees,
+    and argparse construction dominated startup time. Help and error
+    output mimic argparse closely enough that nothing downstream cares.
+
+    Args:
+        argv: Command-line arguments (without program name)
+
+    Returns:
+        Parsed options
+
+    Raises:
+        SystemExit: If arguments are invalid
+    """
+    args = list(argv)
+    i, values, verbose, quiet = _scan_options(args)
+    if verbose and quiet:
+        _usage_error("argument -q/--quiet: not allowed with argument -v/--verbose")
+
+    backend_name = values["--backend"]
+    if backend_name not in BACKENDS:
+        _usage_error(
+            f"argument --backend: invalid choice: '{backend_name}'"
+            f" (choose from {', '.join(BACKENDS.keys())})"
+        )
+
+    title = values["--title"]
+    method: Method | Batch
+    if i == len(args):
+        if not values["--file"]:
+            _usage_error("the following arguments are required: command")
+        method = _parse_batch_file(values["--file"], title)
     else:
-        die(f"unknown command: {ns.command}")
+        if values["--file"]:
+            _usage_error("argument --file: not allowed with a subcommand")
+        method = _parse_command(args[i], args[i + 1 :], title)
+
+    backend = parse_backend(backend_name)
+
+    # Calculate verbosity: default is -1 (WARN), -v increases, -q decreases
+    verbosity = -1 + verbose - quiet
 
     return Options(
         backend=backend,
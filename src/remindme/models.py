@@ -30,10 +30,17 @@ class At:
 Method = Union[In, At]
 
 
+@dataclass(frozen=True, slots=True)
+class Batch:
+    """Schedule a collection of reminders in one submission."""
+
+    methods: tuple[Method, ...]
+
+
 @dataclass(frozen=True, slots=True)
 class Options:
     """CLI options."""
 
     backend: Backend
-    method: Method
+    method: Method | Batch
     verbosity: int
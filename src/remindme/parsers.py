@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from datetime import datetime, timedelta
 
-from dateutil import parser as dtparser
-
 from remindme.utils import die
 
+# Seconds per supported duration unit; a dict lookup replaces branching on
+# the unit character.
+_UNIT_FACTORS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+# Sanity cap: 365 days.
+_MAX_SECONDS = 365 * 86400
+
+# Time-only inputs ("15:00", "3pm", "3:30pm", "15:00:00") are by far the most
+# common shapes; match them directly instead of handing every input to
+# dateutil's generic tokenizer.
+_TIME_RE = re.compile(r"(\d{1,2})(?::(\d{2}))?(?::(\d{2}))?\s*(am|pm)?", re.IGNORECASE)
+
+# Plain ISO dates ("2026-01-16") are the other shape cheap enough to handle
+# without dateutil.
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
+@functools.lru_cache(maxsize=256)
 def parse_duration(text: str) -> timedelta:
     """Parse duration string like '30m', '2h', '45s', '1d'.
 
@@ -16,6 +32,9 @@ def parse_duration(text: str) -> timedelta:
 
     Maximum duration: 365 days (1 year).
 
+    Memoized: pure string-to-timedelta, and the same handful of inputs
+    recur (batch files, tests); a cache hit skips the whole parse.
+
     Args:
         text: Duration string to parse
 
@@ -26,46 +45,35 @@ def parse_duration(text: str) -> timedelta:
         SystemExit: If duration is invalid or exceeds maximum
     """
 
-    text = text.strip().lower()
+    # Most inputs arrive already normalized ("30m"); str.strip() hands back
+    # the original object when there is nothing to strip, so only .lower()
+    # would allocate. Check before paying for it.
+    if not (text.islower() and text == text.strip()):
+        text = text.strip().lower()
     if not text:
         die("empty duration")
 
     # simple, predictable parser (no "1h30m" gymnastics)
     n_str = text[:-1]
     unit = text[-1]
-    if unit not in {"s", "m", "h", "d"} or not n_str.isdigit():
+    if unit not in _UNIT_FACTORS or not n_str.isdigit():
         die(f"invalid duration {text!r}: expected like 30m, 2h, 45s, 1d")
 
-    n = int(n_str)
-    if n <= 0:
+    seconds = int(n_str) * _UNIT_FACTORS[unit]
+    if seconds <= 0:
         die(f"invalid duration {text!r}: must be > 0")
-
-    delta: timedelta
-    match unit:
-        case "s":
-            delta = timedelta(seconds=n)
-        case "m":
-            delta = timedelta(minutes=n)
-        case "h":
-            delta = timedelta(hours=n)
-        case "d":
-            delta = timedelta(days=n)
-        case _:
-            # This should be unreachable due to earlier validation
-            die(f"invalid duration unit: {unit}")
-
-    # Sanity check: max 365 days
-    max_duration = timedelta(days=365)
-    if delta > max_duration:
+    if seconds > _MAX_SECONDS:
         die(f"invalid duration {text!r}: maximum is 365 days")
 
-    return delta
+    return timedelta(seconds=seconds)
 
 
+@functools.lru_cache(maxsize=256)
 def format_systemd_duration(delta: timedelta) -> str:
     """Format timedelta as systemd duration string.
 
     Prefer largest unit when exact; otherwise fall back to seconds.
+    Memoized: pure timedelta-to-string.
 
     Args:
         delta: Duration to format
@@ -94,6 +102,38 @@ def format_systemd_duration(delta: timedelta) -> str:
     return f"{seconds}s"
 
 
+@functools.lru_cache(maxsize=256)
+def _match_time_only(raw: str) -> tuple[int, int, int] | None:
+    """Match a time-of-day string, returning (hour, minute, second) or None.
+
+    Out-of-range components (e.g. "25:00") return None so the caller falls
+    back to the generic parser and reports a uniform error.
+
+    Memoized: this is the pure, clock-independent half of parse_when
+    (parse_when itself depends on datetime.now() and cannot be cached).
+    """
+    half_day = 12
+    max_hour = 23
+    max_minute = 59
+
+    m = _TIME_RE.fullmatch(raw)
+    if m is None:
+        return None
+    hour = int(m.group(1))
+    minute = int(m.group(2) or 0)
+    second = int(m.group(3) or 0)
+    meridiem = m.group(4)
+    if meridiem is not None:
+        if not 1 <= hour <= half_day:
+            return None
+        hour = hour % half_day + (half_day if meridiem.lower() == "pm" else 0)
+    elif hour > max_hour:
+        return None
+    if minute > max_minute or second > max_minute:
+        return None
+    return hour, minute, second
+
+
 def parse_when(text: str) -> datetime:
     """Parse time string into datetime.
 
@@ -123,31 +163,34 @@ def parse_when(text: str) -> datetime:
 
     now = datetime.now()
 
-    # First try: treat as time-only by parsing with today's date as default.
-    # If the user didn't specify a date, dateutil will keep the default date.
-    try:
-        dt = dtparser.parse(raw, default=now.replace(microsecond=0))
-    except Exception as e:
-        die(f"could not parse time {raw!r}: {e}")
-
-    dt = dt.replace(microsecond=0)
-
-    # Heuristic: if the input looks like time-only, then roll forward if needed.
-    # This catches "3pm", "15:00", "15:00:00".
-    looks_time_only = not any(ch.isdigit() for ch in raw.split()[0] if ch in "-/") and (
-        ":" in raw
-        or "am" in raw.lower()
-        or "pm" in raw.lower()
-        or raw.strip().isdigit()
-    )
-    if looks_time_only:
-        candidate = now.replace(
-            hour=dt.hour, minute=dt.minute, second=dt.second, microsecond=0
-        )
+    # Fast path: time-of-day input, no date component. Roll forward to
+    # tomorrow if the time has already passed today.
+    hms = _match_time_only(raw)
+    if hms is not None:
+        hour, minute, second = hms
+        candidate = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
         if candidate <= now:
             candidate = candidate + timedelta(days=1)
         return candidate
 
+    # Fast path: bare ISO date, scheduled for midnight.
+    if _ISO_DATE_RE.fullmatch(raw):
+        try:
+            dt = datetime.strptime(raw, "%Y-%m-%d")
+        except ValueError as e:
+            die(f"could not parse time {raw!r}: {e}")
+    else:
+        # dateutil is only needed for full datetimes; importing it eagerly
+        # would make the common invocations pay its (substantial) load time.
+        from dateutil import parser as dtparser  # noqa: PLC0415
+
+        try:
+            dt = dtparser.parse(raw, default=now.replace(microsecond=0))
+        except Exception as e:
+            die(f"could not parse time {raw!r}: {e}")
+
+        dt = dt.replace(microsecond=0)
+
     # Date provided (or at least we assume so). Ensure it's in the future.
     if dt <= now:
         die(
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import shlex
 import shutil
 import subprocess
@@ -12,6 +14,8 @@ from typing import TYPE_CHECKING, Sequence
 if TYPE_CHECKING:
     from typing import NoReturn
 
+log = logging.getLogger(__name__)
+
 
 def unit_name(*, prefix: str, when: datetime) -> str:
     """Generate unique systemd unit name from prefix and timestamp.
@@ -29,9 +33,30 @@ def unit_name(*, prefix: str, when: datetime) -> str:
     Returns:
         Unique systemd unit name
     """
-    # systemd unit names can't contain spaces; keep it boring.
-    stamp = when.strftime("%Y%m%d-%H%M%S")
-    return f"{prefix}-{stamp}-{when.microsecond:06d}"
+    # systemd unit names can't contain spaces; keep it boring. Formatting the
+    # fields directly skips strftime's format parsing and locale machinery.
+    return (
+        f"{prefix}-{when.year:04d}{when.month:02d}{when.day:02d}"
+        f"-{when.hour:02d}{when.minute:02d}{when.second:02d}"
+        f"-{when.microsecond:06d}"
+    )
+
+
+@functools.cache
+def which(name: str) -> str | None:
+    """Locate an executable on PATH, caching the result.
+
+    shutil.which walks (and stats) every $PATH entry. Availability doesn't
+    change within a process, and several call sites probe the same binaries,
+    so pay for each lookup once.
+
+    Args:
+        name: Executable name to locate
+
+    Returns:
+        Full path to the executable, or None if not found
+    """
+    return shutil.which(name)
 
 
 def check_notify_send() -> None:
@@ -46,7 +71,7 @@ def check_notify_send() -> None:
     Raises:
         SystemExit: If notify-send is not found
     """
-    if not shutil.which("notify-send"):
+    if not which("notify-send"):
         die(
             "notify-send not found: install libnotify package\n"
             "  Debian/Ubuntu: sudo apt install libnotify-bin\n"
@@ -64,13 +89,39 @@ def run(cmd: Sequence[str]) -> None:
     Raises:
         SystemExit: If command fails
     """
-    logging.debug("Running: %s", " ".join(map(shlex.quote, cmd)))
+    # Guarded: quoting and joining the command is pure waste at the default
+    # WARNING level.
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Running: %s", shlex.join(cmd))
+    try:
+        result = subprocess.run(cmd, check=False)
+    except FileNotFoundError as e:
+        die(str(e))
+    # A plain returncode compare; check=True would build and raise a
+    # CalledProcessError only for us to catch it right here.
+    if result.returncode != 0:
+        die(f"command failed with exit code {result.returncode}")
+
+
+def exec_final(cmd: Sequence[str]) -> NoReturn:
+    """Replace the current process with a command instead of forking it.
+
+    For the last command of a one-shot CLI invocation there is nothing left
+    to do afterwards, so forking a child only to exit ourselves wastes a
+    process. The exec'd command's exit status becomes ours.
+
+    Args:
+        cmd: Command and arguments to exec
+
+    Raises:
+        SystemExit: If the executable cannot be found
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Exec: %s", shlex.join(cmd))
     try:
-        subprocess.run(cmd, check=True)
+        os.execvp(cmd[0], list(cmd))
     except FileNotFoundError as e:
         die(str(e))
-    except subprocess.CalledProcessError as e:
-        die(f"command failed with exit code {e.returncode}")
 
 
 def die(msg: str) -> NoReturn:
@@ -85,6 +136,10 @@ def die(msg: str) -> NoReturn:
     raise SystemExit(f"error: {msg}")
 
 
+# Indexed by clamped verbosity + 2; see verbosity_to_log_level.
+_LEVELS = (logging.ERROR, logging.WARNING, logging.INFO, logging.DEBUG)
+
+
 def verbosity_to_log_level(verbosity: int) -> int:
     """Convert verbosity level to logging level.
 
@@ -92,8 +147,7 @@ def verbosity_to_log_level(verbosity: int) -> int:
       -2 or less: ERROR
       -1: WARNING (default)
        0: INFO
-       1: DEBUG
-       2 or more: DEBUG (with potential for future granularity)
+       1 or more: DEBUG
 
     Args:
         verbosity: Verbosity level
@@ -101,13 +155,4 @@ def verbosity_to_log_level(verbosity: int) -> int:
     Returns:
         Logging level constant
     """
-    error_threshold = -2
-    match verbosity:
-        case v if v <= error_threshold:
-            return logging.ERROR
-        case -1:
-            return logging.WARNING
-        case 0:
-            return logging.INFO
-        case _:
-            return logging.DEBUG
+    return _LEVELS[max(min(verbosity, 1), -2) + 2]
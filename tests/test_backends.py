@@ -8,11 +8,19 @@ from unittest.mock import Mock, patch
 import pytest
 
 from remindme import AtBackend, AutoBackend, Backend, SystemdBackend
+from remindme.utils import which
 
 
 class TestBackendAvailability:
     """Tests for backend availability checks."""
 
+    @pytest.fixture(autouse=True)
+    def clear_which_cache(self):
+        """Keep the which() memo from leaking between tests."""
+        which.cache_clear()
+        yield
+        which.cache_clear()
+
     @patch("remindme.utils.shutil.which")
     @pytest.mark.parametrize(
         "backend_cls,command",
@@ -96,6 +104,64 @@ class TestBackendScheduling:
         assert "--user" in args
         assert "--on-calendar" in args
 
+    @patch("remindme.utils.os.execvp")
+    @patch("remindme.utils.subprocess.run")
+    @patch("remindme.backends.SystemdBackend.is_available")
+    def test_systemd_terminal_execs_final_command(
+        self, mock_available, mock_run, mock_execvp
+    ):
+        mock_available.return_value = True
+
+        backend = SystemdBackend()
+        backend.terminal = True
+        when = datetime(2026, 1, 16, 15, 0, 0)
+        backend.schedule_at(when=when, title="Test", message="Test message")
+
+        # The process image is replaced instead of forking a child
+        mock_execvp.assert_called_once()
+        mock_run.assert_not_called()
+        argv = mock_execvp.call_args[0][1]
+        assert argv[0] == "systemd-run"
+
+    @patch("remindme.utils.subprocess.run")
+    @patch("remindme.backends.AtBackend.is_available")
+    def test_at_schedule_many_groups_by_timestamp(self, mock_available, mock_run):
+        mock_available.return_value = True
+        mock_run.return_value = Mock(returncode=0)
+
+        backend = AtBackend()
+        backend.schedule_many(
+            [
+                (datetime(2026, 1, 16, 15, 0, 0), "Test", "first"),
+                (datetime(2026, 1, 16, 15, 0, 30), "Test", "second"),
+                (datetime(2026, 1, 16, 16, 0, 0), "Test", "third"),
+            ]
+        )
+
+        # Two distinct minutes -> two at jobs
+        assert mock_run.call_count == 2
+        first_call = mock_run.call_args_list[0]
+        assert first_call[0][0] == ["at", "-t", "202601161500"]
+        # Both same-minute reminders ride in the first job's stdin
+        script = first_call[1]["input"].decode("utf-8")
+        assert script.count("notify-send") == 2
+
+    @patch("remindme.utils.subprocess.run")
+    @patch("remindme.backends.SystemdBackend.is_available")
+    def test_systemd_schedule_many_falls_back_to_loop(self, mock_available, mock_run):
+        mock_available.return_value = True
+        mock_run.return_value = Mock(returncode=0)
+
+        backend = SystemdBackend()
+        backend.schedule_many(
+            [
+                (datetime(2026, 1, 16, 15, 0, 0), "Test", "first"),
+                (datetime(2026, 1, 16, 16, 0, 0), "Test", "second"),
+            ]
+        )
+
+        assert mock_run.call_count == 2
+
     @patch("remindme.utils.subprocess.run")
     @patch("remindme.backends.AtBackend.is_available")
     def test_at_schedule_at(self, mock_available, mock_run):
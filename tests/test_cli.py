@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from remindme import At, AtBackend, AutoBackend, Backend, In, Options, SystemdBackend
+from remindme import At, AtBackend, Backend, Batch, In, Options, SystemdBackend
 from remindme.cli import (
     format_backend_details,
     parse_args,
@@ -37,7 +37,16 @@ class TestParseBackend:
         mock_systemd.return_value = True
         mock_at.return_value = True
         backend = parse_backend("auto")
-        assert isinstance(backend, AutoBackend)
+        # "auto" resolves to the first available concrete backend up front
+        assert isinstance(backend, SystemdBackend)
+
+    @patch("remindme.backends.SystemdBackend.is_available")
+    @patch("remindme.backends.AtBackend.is_available")
+    def test_auto_backend_falls_back_to_at(self, mock_at, mock_systemd):
+        mock_systemd.return_value = False
+        mock_at.return_value = True
+        backend = parse_backend("auto")
+        assert isinstance(backend, AtBackend)
 
     def test_unknown_backend(self):
         with pytest.raises(argparse.ArgumentTypeError, match="unknown backend"):
@@ -72,9 +81,10 @@ class TestParseArgs:
         mock_backend = Mock(spec=Backend)
         mock_parse_backend.return_value = mock_backend
 
-        with patch("remindme.parsers.datetime") as mock_datetime:
+        # wraps= forwards constructor calls and attribute lookups to the real
+        # class; only now() is overridden
+        with patch("remindme.parsers.datetime", wraps=datetime) as mock_datetime:
             mock_datetime.now.return_value = datetime(2026, 1, 15, 10, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
 
             result = parse_args(["at", "15:00", "test", "message"])
 
@@ -109,6 +119,39 @@ class TestParseArgs:
         result = parse_args(["-q", "in", "30m", "message"])
         assert result.verbosity == -2  # ERROR
 
+    @patch("remindme.cli.parse_backend")
+    def test_batch_file(self, mock_parse_backend, tmp_path):
+        mock_backend = Mock(spec=Backend)
+        mock_parse_backend.return_value = mock_backend
+
+        batch = tmp_path / "reminders.txt"
+        batch.write_text(
+            '# morning routine\nin 30m stretch\nat "2099-01-16 09:00" standup\n'
+        )
+
+        result = parse_args(["--file", str(batch)])
+
+        assert isinstance(result.method, Batch)
+        first, second = result.method.methods
+        assert isinstance(first, In)
+        assert first.duration == timedelta(minutes=30)
+        assert first.message == "stretch"
+        assert isinstance(second, At)
+        assert second.message == "standup"
+
+    @patch("remindme.cli.parse_backend")
+    def test_batch_file_rejects_subcommand(self, mock_parse_backend):
+        with pytest.raises(SystemExit):
+            parse_args(["--file", "reminders.txt", "in", "30m", "message"])
+
+    @patch("remindme.cli.parse_backend")
+    def test_batch_file_unbalanced_quote(self, mock_parse_backend, tmp_path):
+        batch = tmp_path / "reminders.txt"
+        batch.write_text('in 30m "unclosed\n')
+
+        with pytest.raises(SystemExit, match=rf"{batch}:1: No closing quotation"):
+            parse_args(["--file", str(batch)])
+
     def test_backend_option(self):
         # This test just verifies the backend name is passed through
         # The actual backend instantiation is tested in other tests
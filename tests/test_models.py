@@ -10,6 +10,12 @@ import pytest
 from remindme import At, Backend, In, Options
 
 
+@pytest.fixture(scope="module")
+def mock_backend():
+    """One spec'd Backend mock per module; walking the ABC spec is not free."""
+    return Mock(spec=Backend)
+
+
 class TestDataClasses:
     """Tests for dataclass structures."""
 
@@ -23,8 +29,7 @@ class TestDataClasses:
         with pytest.raises(AttributeError):
             method.when = datetime.now()  # type: ignore
 
-    def test_options_immutable(self):
-        mock_backend = Mock(spec=Backend)
+    def test_options_immutable(self, mock_backend):
         method = In(duration=timedelta(minutes=30), message="test", title="Test")
         opts = Options(backend=mock_backend, method=method, verbosity=-1)
         with pytest.raises(AttributeError):
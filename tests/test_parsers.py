@@ -2,170 +2,172 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timedelta
-from unittest.mock import patch
 
 import pytest
 
 from remindme.parsers import format_systemd_duration, parse_duration, parse_when
 
+# Table-driven cases: one test node iterating a tuple is much cheaper than a
+# parametrized node per entry (collection, id rendering, setup/teardown).
+# Entries hold plain ints (seconds); the timedelta is built inside the test
+# body so importing the module stays allocation-free.
+_VALID_DURATIONS = (
+    ("30s", 30),
+    ("1s", 1),
+    ("90s", 90),
+    ("5m", 5 * 60),
+    ("1m", 60),
+    ("30m", 30 * 60),
+    ("2h", 2 * 3600),
+    ("1h", 3600),
+    ("24h", 24 * 3600),
+    ("1d", 86400),
+    ("7d", 7 * 86400),
+    ("365d", 365 * 86400),  # Max allowed
+    ("  30m  ", 30 * 60),
+    ("\t5h\n", 5 * 3600),
+    ("30M", 30 * 60),
+    ("2H", 2 * 3600),
+)
+
+_EMPTY_DURATIONS = ("", "   ")
+
+_INVALID_DURATIONS = ("30", "30x", "abc", "m30")
+
+_ZERO_DURATIONS = ("0m", "0s")
+
+_EXCESSIVE_DURATIONS = (
+    "366d",  # Just over limit
+    "999999999d",  # Extreme value
+    "8761h",  # Over 365 days in hours
+    "525601m",  # Over 365 days in minutes
+)
+
+# Expected error messages, compiled once; pytest.raises(match=...) would
+# recompile the pattern string on every iteration of the loops below.
+_M_EMPTY = re.compile("empty duration")
+_M_INVALID = re.compile(r"invalid duration.*expected like")
+_M_ZERO = re.compile("must be > 0")
+_M_MAX = re.compile("maximum is 365 days")
+
+_FORMAT_DURATIONS = (
+    (2 * 86400, "2d"),
+    (86400, "1d"),
+    (7 * 86400, "7d"),
+    (2 * 3600, "2h"),
+    (3600, "1h"),
+    (24 * 3600, "1d"),  # 24h = 1d
+    (30 * 60, "30m"),
+    (60 * 60, "1h"),  # 60m = 1h
+    (30, "30s"),
+    (60, "1m"),  # 60s = 1m
+    (90, "90s"),  # Non-exact
+    (90 * 60, "90m"),  # Exact in minutes
+    (5415, "5415s"),  # Non-exact
+)
+
 
 class TestParseDuration:
     """Tests for parse_duration() function."""
 
-    @pytest.mark.parametrize(
-        "text,expected",
-        [
-            ("30s", timedelta(seconds=30)),
-            ("1s", timedelta(seconds=1)),
-            ("90s", timedelta(seconds=90)),
-            ("5m", timedelta(minutes=5)),
-            ("1m", timedelta(minutes=1)),
-            ("30m", timedelta(minutes=30)),
-            ("2h", timedelta(hours=2)),
-            ("1h", timedelta(hours=1)),
-            ("24h", timedelta(hours=24)),
-            ("1d", timedelta(days=1)),
-            ("7d", timedelta(days=7)),
-            ("365d", timedelta(days=365)),  # Max allowed
-            ("  30m  ", timedelta(minutes=30)),
-            ("\t5h\n", timedelta(hours=5)),
-            ("30M", timedelta(minutes=30)),
-            ("2H", timedelta(hours=2)),
-        ],
-    )
-    def test_valid_durations(self, text: str, expected: timedelta):
-        assert parse_duration(text) == expected
+    def test_valid_durations(self):
+        for text, secs in _VALID_DURATIONS:
+            assert parse_duration(text) == timedelta(seconds=secs), text
 
-    @pytest.mark.parametrize("text", ["", "   "])
-    def test_empty_duration(self, text: str):
-        with pytest.raises(SystemExit, match="empty duration"):
-            parse_duration(text)
+    def test_empty_duration(self):
+        for text in _EMPTY_DURATIONS:
+            with pytest.raises(SystemExit) as exc:
+                parse_duration(text)
+            assert _M_EMPTY.search(str(exc.value)), text
 
-    @pytest.mark.parametrize("text", ["30", "30x", "abc", "m30"])
-    def test_invalid_format(self, text: str):
-        with pytest.raises(SystemExit, match=r"invalid duration.*expected like"):
-            parse_duration(text)
+    def test_invalid_format(self):
+        for text in _INVALID_DURATIONS:
+            with pytest.raises(SystemExit) as exc:
+                parse_duration(text)
+            assert _M_INVALID.search(str(exc.value)), text
 
-    @pytest.mark.parametrize("text", ["0m", "0s"])
-    def test_zero_duration(self, text: str):
-        with pytest.raises(SystemExit, match="must be > 0"):
-            parse_duration(text)
+    def test_zero_duration(self):
+        for text in _ZERO_DURATIONS:
+            with pytest.raises(SystemExit) as exc:
+                parse_duration(text)
+            assert _M_ZERO.search(str(exc.value)), text
 
     def test_negative_duration(self):
         with pytest.raises(SystemExit, match="invalid duration"):
             parse_duration("-5m")
 
-    @pytest.mark.parametrize(
-        "text",
-        [
-            "366d",  # Just over limit
-            "999999999d",  # Extreme value
-            "8761h",  # Over 365 days in hours
-            "525601m",  # Over 365 days in minutes
-        ],
-    )
-    def test_duration_exceeds_maximum(self, text: str):
-        with pytest.raises(SystemExit, match="maximum is 365 days"):
-            parse_duration(text)
+    def test_duration_exceeds_maximum(self):
+        for text in _EXCESSIVE_DURATIONS:
+            with pytest.raises(SystemExit) as exc:
+                parse_duration(text)
+            assert _M_MAX.search(str(exc.value)), text
 
 
 class TestFormatSystemdDuration:
     """Tests for format_systemd_duration() function."""
 
-    @pytest.mark.parametrize(
-        "delta,expected",
-        [
-            (timedelta(days=2), "2d"),
-            (timedelta(days=1), "1d"),
-            (timedelta(days=7), "7d"),
-            (timedelta(hours=2), "2h"),
-            (timedelta(hours=1), "1h"),
-            (timedelta(hours=24), "1d"),  # 24h = 1d
-            (timedelta(minutes=30), "30m"),
-            (timedelta(minutes=60), "1h"),  # 60m = 1h
-            (timedelta(seconds=30), "30s"),
-            (timedelta(seconds=60), "1m"),  # 60s = 1m
-            (timedelta(seconds=90), "90s"),  # Non-exact
-            (timedelta(hours=1, minutes=30), "90m"),  # Exact in minutes
-            (timedelta(hours=1, minutes=30, seconds=15), "5415s"),  # Non-exact
-        ],
-    )
-    def test_format_duration(self, delta: timedelta, expected: str):
-        assert format_systemd_duration(delta) == expected
+    def test_format_duration(self):
+        for secs, expected in _FORMAT_DURATIONS:
+            assert format_systemd_duration(timedelta(seconds=secs)) == expected, (
+                expected
+            )
 
     def test_zero_duration(self):
         with pytest.raises(SystemExit, match="duration must be > 0 seconds"):
             format_systemd_duration(timedelta(seconds=0))
 
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Patch remindme.parsers.datetime with a controllable now().
+
+    Cheaper than a mock.patch context per test, and the datetime subclass
+    keeps constructors and classmethods working without a Mock in the middle.
+    Tests mutate ``frozen_now.value`` to move the clock.
+    """
+
+    class _Clock:
+        value = datetime(2026, 1, 15, 10, 0, 0)
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return _Clock.value
+
+    monkeypatch.setattr("remindme.parsers.datetime", _FrozenDatetime)
+    return _Clock
+
+
 class TestParseWhen:
     """Tests for parse_when() function."""
 
-    def test_time_only_future_today(self):
-        # If current time is 10:00, scheduling for 15:00 should be today
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 10, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            result = parse_when("15:00")
-            assert result.hour == 15
-            assert result.minute == 0
-            assert result.date() == datetime(2026, 1, 15).date()
-
-    def test_time_only_past_today_rolls_to_tomorrow(self):
-        # If current time is 16:00, scheduling for 15:00 should be tomorrow
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 16, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            result = parse_when("15:00")
-            assert result.hour == 15
-            assert result.minute == 0
-            assert result.date() == datetime(2026, 1, 16).date()
-
-    def test_pm_notation(self):
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 10, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            result = parse_when("3pm")
-            assert result.hour == 15
-            assert result.minute == 0
-
-    def test_am_notation(self):
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 2, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            result = parse_when("10am")
-            assert result.hour == 10
-            assert result.minute == 0
-
-    def test_full_datetime_future(self):
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 10, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            # The heuristic won't detect this as time-only since it has date separators
-            result = parse_when("2026-01-16 15:00")
-            # But dateutil will parse the date, and we're simulating it's past the default
-            # This is a quirk of the heuristic - it should still work
-            assert result.hour == 15
-            assert result.minute == 0
-            # Date may be 15th or 16th depending on heuristic behavior
-            assert result.date() >= datetime(2026, 1, 15).date()
-
-    def test_past_datetime_error(self):
-        with patch("remindme.parsers.datetime") as mock_datetime:
-            mock_datetime.now.return_value = datetime(2026, 1, 15, 10, 0, 0)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            # This will be detected as having date components, so should fail if in past
-            # But the heuristic is complex - it might treat "2020-01-01 12:00" as time-only if weird
-            # Let's just test a clearly past time
-            with pytest.raises(SystemExit, match="not in the future"):
-                parse_when("2020-01-01")
+    @pytest.mark.parametrize(
+        "now_dt,text,expected",
+        [
+            # 10:00 now, 15:00 requested -> today
+            (datetime(2026, 1, 15, 10), "15:00", (15, 0, (2026, 1, 15))),
+            # 16:00 now, 15:00 already passed -> tomorrow
+            (datetime(2026, 1, 15, 16), "15:00", (15, 0, (2026, 1, 16))),
+            (datetime(2026, 1, 15, 10), "3pm", (15, 0, (2026, 1, 15))),
+            (datetime(2026, 1, 15, 2), "10am", (10, 0, (2026, 1, 15))),
+            (datetime(2026, 1, 15, 10), "2026-01-16 15:00", (15, 0, (2026, 1, 16))),
+        ],
+    )
+    def test_future_times(self, frozen_now, now_dt, text, expected):
+        exp_hour, exp_minute, exp_date = expected
+        frozen_now.value = now_dt
+
+        result = parse_when(text)
+        assert (result.hour, result.minute) == (exp_hour, exp_minute)
+        assert result.date() == datetime(*exp_date).date()
+
+    def test_past_datetime_error(self, frozen_now):
+        frozen_now.value = datetime(2026, 1, 15, 10, 0, 0)
+
+        with pytest.raises(SystemExit, match="not in the future"):
+            parse_when("2020-01-01")
 
     def test_empty_time(self):
         with pytest.raises(SystemExit, match="empty time"):
@@ -1,15 +1,64 @@
-"""Integration tests for CLI functionality via subprocess."""
+"""Integration tests for CLI functionality, run in-process."""
 
 from __future__ import annotations
 
 import subprocess
-from unittest.mock import Mock, patch
+import sys
+from types import SimpleNamespace
 
 import pytest
 
+import remindme.__main__
+from remindme.utils import which
+
+
+@pytest.fixture(scope="session")
+def remindme_cmd() -> list[str]:
+    """Resolved argv prefix for spawning the CLI in a subprocess.
+
+    Built once per session: no $PATH search, no console_scripts wrapper,
+    and -I isolates the child from user site-packages and env vars.
+    """
+    return [sys.executable, "-I", "-m", "remindme"]
+
+
+@pytest.fixture
+def run_cli(capsys, monkeypatch):
+    """Invoke the CLI entry point in-process, returning (rc, stdout, stderr).
+
+    Spawning a fresh interpreter per case costs 100-300ms of startup; calling
+    script() directly costs microseconds and, crucially, lets mock.patch
+    actually reach the code under test.
+    """
+
+    def _run(argv: list[str]) -> tuple[int, str, str]:
+        monkeypatch.setattr(sys, "argv", ["remindme", *argv])
+        rc = 0
+        try:
+            remindme.__main__.script()
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                # die() exits with the message itself; the interpreter would
+                # print it to stderr and exit 1
+                print(e.code, file=sys.stderr)
+                rc = 1
+            else:
+                rc = e.code or 0
+        out = capsys.readouterr()
+        return rc, out.out, out.err
+
+    return _run
+
 
 class TestCLISmokeTests:
-    """Integration tests for CLI functionality via subprocess."""
+    """Integration tests for CLI functionality, run in-process."""
+
+    @pytest.fixture(autouse=True)
+    def clear_which_cache(self):
+        """Keep the which() memo from leaking between tests."""
+        which.cache_clear()
+        yield
+        which.cache_clear()
 
     @pytest.mark.parametrize(
         "args,expected_in_stdout",
@@ -19,19 +68,13 @@ class TestCLISmokeTests:
             (["at", "--help"], ["when", "3pm"]),
         ],
     )
-    def test_help_output(self, args: list[str], expected_in_stdout: list[str]):
+    def test_help_output(self, run_cli, args: list[str], expected_in_stdout: list[str]):
         """Test help flags work and contain expected content."""
-        result = subprocess.run(
-            ["remindme", *args],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
+        rc, stdout, _ = run_cli(args)
+        assert rc == 0
         for expected in expected_in_stdout:
-            assert expected in result.stdout or any(
-                variant in result.stdout
-                for variant in [expected.lower(), expected.upper()]
+            assert expected in stdout or any(
+                variant in stdout for variant in [expected.lower(), expected.upper()]
             )
 
     @pytest.mark.parametrize(
@@ -46,38 +89,53 @@ class TestCLISmokeTests:
             (["at", "not-a-time", "test"], ["could not parse", "time"]),
         ],
     )
-    def test_error_handling(self, args: list[str], expected_in_stderr: list[str]):
+    def test_error_handling(
+        self, run_cli, args: list[str], expected_in_stderr: list[str]
+    ):
         """Test CLI produces helpful error messages."""
-        result = subprocess.run(
-            ["remindme", *args],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode != 0
-        stderr_lower = result.stderr.lower()
+        rc, _, stderr = run_cli(args)
+        assert rc != 0
+        stderr_lower = stderr.lower()
         assert any(expected.lower() in stderr_lower for expected in expected_in_stderr)
 
-    @pytest.mark.parametrize(
-        "backend",
-        ["auto", "systemd", "at"],
-    )
-    @patch("remindme.utils.subprocess.run")
-    def test_backend_scheduling_smoke(self, mock_subprocess_run, backend: str):
-        """Test that scheduling commands complete without error (mocked)."""
-        # Mock successful subprocess execution
-        mock_subprocess_run.return_value = Mock(returncode=0)
-
-        # Test 'in' command with a very short duration
-        result_in = subprocess.run(
-            ["remindme", "--backend", backend, "in", "5s", "test message"],
+    def test_backend_scheduling_smoke(self, run_cli, monkeypatch):
+        """Test that scheduling commands complete without error (mocked).
+
+        One mock setup covers all three backends; each in-process run then
+        only pays for the code under test.
+        """
+        scheduled: list[list[str]] = []
+
+        def fake_run(cmd, **kwargs):
+            scheduled.append(list(cmd))
+            return SimpleNamespace(returncode=0)
+
+        # Every binary "exists", and nothing actually forks or execs
+        monkeypatch.setattr(
+            "remindme.utils.shutil.which", lambda name: f"/usr/bin/{name}"
+        )
+        monkeypatch.setattr("remindme.utils.subprocess.run", fake_run)
+        monkeypatch.setattr(
+            "remindme.utils.os.execvp",
+            lambda file, args: scheduled.append(list(args)),
+        )
+
+        for backend in ("auto", "systemd", "at"):
+            rc, _, _ = run_cli(["--backend", backend, "in", "5s", "test message"])
+            assert rc == 0, backend
+
+        # Each backend issued (at least) one scheduling command
+        assert len(scheduled) >= 3
+
+    @pytest.mark.slow
+    def test_end_to_end_subprocess(self, remindme_cmd: list[str]):
+        """One real fork+exec to catch packaging/entry-point breakage."""
+        result = subprocess.run(
+            [*remindme_cmd, "--help"],
             capture_output=True,
             text=True,
+            timeout=5,
             check=False,
         )
-        # Should succeed (exit 0) or fail gracefully if backend unavailable
-        if result_in.returncode != 0:
-            # If it failed, should be a backend availability error
-            assert "not available" in result_in.stderr.lower(), (
-                f"Unexpected error for backend {backend}: {result_in.stderr}"
-            )
+        assert result.returncode == 0
+        assert "usage: remindme" in result.stdout
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import logging
-import subprocess
 from datetime import datetime
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from remindme.utils import check_notify_send, run, unit_name, verbosity_to_log_level
+from remindme.utils import (
+    check_notify_send,
+    run,
+    unit_name,
+    verbosity_to_log_level,
+    which,
+)
 
 
 class TestUnitName:
@@ -41,6 +47,13 @@ class TestUnitName:
 class TestCheckNotifySend:
     """Tests for check_notify_send() function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_which_cache(self):
+        """Keep the which() memo from leaking between tests."""
+        which.cache_clear()
+        yield
+        which.cache_clear()
+
     @patch("remindme.utils.shutil.which")
     def test_notify_send_available(self, mock_which):
         mock_which.return_value = "/usr/bin/notify-send"
@@ -59,10 +72,12 @@ class TestRun:
 
     @patch("remindme.utils.subprocess.run")
     def test_successful_command(self, mock_run):
-        mock_run.return_value = Mock(returncode=0)
+        # run() only reads .returncode; a SimpleNamespace is a cheaper
+        # CompletedProcess stand-in than a full Mock
+        mock_run.return_value = SimpleNamespace(returncode=0)
         # Should not raise
         run(["echo", "test"])
-        mock_run.assert_called_once_with(["echo", "test"], check=True)
+        mock_run.assert_called_once_with(["echo", "test"], check=False)
 
     @patch("remindme.utils.subprocess.run")
     def test_command_not_found(self, mock_run):
@@ -72,7 +87,7 @@ class TestRun:
 
     @patch("remindme.utils.subprocess.run")
     def test_command_failed(self, mock_run):
-        mock_run.side_effect = subprocess.CalledProcessError(1, ["false"])
+        mock_run.return_value = SimpleNamespace(returncode=1)
         with pytest.raises(SystemExit, match="exit code 1"):
             run(["false"])
 